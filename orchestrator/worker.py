@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import logging
 import os
+import queue
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, Dict
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional
 
 import google.generativeai as genai
+import orjson
 from dotenv import load_dotenv
 
 # Add project root to path
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from shared.storage import pop_job, update_run
+from shared.storage import pop_jobs, update_run
 from shared.tools import (
+    Tool,
     TavilySearchTool,
     WeatherTool,
     CalculatorTool,
@@ -28,22 +38,114 @@ from shared.tools import (
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "../config/.env"))
 
+# Per-step agent tracing is DEBUG; set LOG_LEVEL=DEBUG to see thoughts and tool output
+logger = logging.getLogger("orchestrator")
+
+# Gemini model used by the agent loop and the worker
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+# Upper bound on tool calls executed concurrently for a single "parallel" step
+MAX_PARALLEL_TOOLS = int(os.getenv("MAX_PARALLEL_TOOLS", "4"))
+# Jobs the queue worker runs concurrently; free slots are refilled as jobs finish
+JOB_BATCH_SIZE = int(os.getenv("JOB_BATCH_SIZE", "16"))
+# Longest the queue worker waits for new jobs while others are still running
+JOB_REFILL_POLL_S = 0.5
+# Tools whose repeated use without an answer triggers the "stuck searching" alert
+SEARCH_TOOLS = frozenset({"web_search", "get_news", "wikipedia"})
+# Longest tool observation quoted back to the model in the scratchpad; the full
+# output is still kept as evidence
+MAX_OBSERVATION_CHARS = int(os.getenv("MAX_OBSERVATION_CHARS", "4000"))
+# Most recent chat history entries included in each step's prompt
+CHAT_HISTORY_MAX_TURNS = int(os.getenv("CHAT_HISTORY_MAX_TURNS", "8"))
+
+# Prompts answered locally, without any Gemini round-trip
+DIRECT_GREETING_RE = re.compile(
+    r"^\s*(hi|hii+|hello|hey|hey there|good (morning|afternoon|evening)|thanks|thank you)[\s!.?]*$",
+    re.IGNORECASE,
+)
+DIRECT_GREETING_ANSWER = "Hello! Ask me a question or share a claim and I'll look into it."
+# Arithmetic answered without the agent. Only explicit math counts, i.e. a
+# "calculate/compute/evaluate" verb or a trailing "=" ("compute 2+2",
+# "what is (3 * 4) / 2 =?"): bare "9/11", "24/7" or "2023-24" are claims
+# and dates, not sums, and go to the agent.
+_MATH_EXPR = r"(?P<expr>[\d.\s()]*\d[\d.\s()]*(?:[-+*/][\d.\s()]*\d[\d.\s()]*)+)"
+DIRECT_MATH_RE = re.compile(
+    rf"^\s*(?:(?:calculate|compute|evaluate)\s+{_MATH_EXPR}\s*[=?]?"
+    rf"|(?:(?:what is|what's)\s+)?{_MATH_EXPR.replace('expr', 'expr_eq')}\s*=\s*\??)\s*$",
+    re.IGNORECASE,
+)
+
+# Short prompts that already name what to look up are sent to the agent as-is
+SPECIFIC_PROMPT_MAX_WORDS = 12
+SPECIFIC_PROMPT_RE = re.compile(
+    r"\b(weather|temperature|stock|share price|price|news|wikipedia|time in|convert|calculate)\b",
+    re.IGNORECASE,
+)
+
+# Outermost {...} span of a model decision (first "{" to last "}")
+DECISION_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
 
-@dataclass
+
+def parse_decision(text: str) -> Dict[str, Any]:
+    """Extract and decode the JSON decision object from a model response."""
+    match = DECISION_JSON_RE.search(text)
+    if match is None:
+        raise ValueError("No JSON object found in response")
+    return orjson.loads(match.group())
+
+
+def truncate_observation(result: Any) -> str:
+    result = str(result)
+    if len(result) <= MAX_OBSERVATION_CHARS:
+        return result
+    return f"{result[:MAX_OBSERVATION_CHARS]}... [truncated {len(result) - MAX_OBSERVATION_CHARS} chars]"
+
+
+@dataclass(slots=True)
 class ToolOutput:
     tool_name: str
     content: str
     metadata: Dict[str, Any]
 
+    def asdict(self) -> Dict[str, Any]:
+        return {"tool_name": self.tool_name, "content": self.content, "metadata": self.metadata}
+
+
+@lru_cache(maxsize=None)
+def get_shared_model(api_key: str, model_name: str = GEMINI_MODEL) -> genai.GenerativeModel:
+    """Configure genai and build the Gemini model once per process.
+
+    ``genai.configure`` drops the library's cached clients, so configuring per
+    worker would open a new Gemini channel for every request and throw away the
+    one warmed up at startup. Workers share this model instead.
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
 
 class AgentRouter:
-    def __init__(self, tools, api_key):
+    def __init__(self, tools, api_key, model_name: str = GEMINI_MODEL):
         self.tools = {t.name: t for t in tools}
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model = get_shared_model(api_key, model_name)
         self.chat_history = []
+        self.tool_desc_str = self._describe_tools()
+        self._system_prompt_cache: Dict[str, tuple[str, str]] = {}
+
+    def _describe_tools(self) -> str:
+        """Render tool descriptions from their Pydantic schemas (invariant per router)."""
+        tool_descriptions = []
+        for t in self.tools.values():
+            schema = t.args_schema.model_json_schema()
+            # Simplified schema representation for the prompt
+            args_desc = ", ".join([f"{k}: {v.get('description', '')} ({v.get('type', 'any')})" for k, v in schema.get('properties', {}).items()])
+            tool_descriptions.append(f"- {t.name}: {t.description} Arguments: {{{args_desc}}}")
+        return "\n".join(tool_descriptions)
 
     def _expand_query(self, prompt: str) -> str:
+        if len(prompt.split()) <= SPECIFIC_PROMPT_MAX_WORDS and SPECIFIC_PROMPT_RE.search(prompt):
+            # The expansion prompt returns clear requests unchanged; skip the round-trip
+            logger.debug("[Query Expansion] Skipped for specific prompt: %r", prompt)
+            return prompt
+
         expansion_prompt = f"""
         You are an expert at refining user queries for search engines and tools.
         Rewrite the following user prompt to be more specific, detailed, and optimized for an autonomous agent to solve.
@@ -61,20 +163,100 @@ class AgentRouter:
             response = self.model.generate_content(expansion_prompt)
             expanded_prompt = response.text.strip()
             if not expanded_prompt:
-                print(f"  [Query Expansion] Empty response. Using original prompt.")
+                logger.debug("[Query Expansion] Empty response. Using original prompt.")
                 return prompt
             
             # Guardrail check: If the model refuses to expand (e.g. "I cannot..."), fallback to original
             if expanded_prompt.lower().startswith(("i cannot", "i am unable", "i'm unable", "sorry")):
-                print(f"  [Query Expansion] Refusal detected ('{expanded_prompt[:50]}...'). Using original prompt.")
+                logger.debug("[Query Expansion] Refusal detected (%r...). Using original prompt.", expanded_prompt[:50])
                 return prompt
 
-            print(f"  [Query Expansion] Original: '{prompt}' -> Expanded: '{expanded_prompt}'")
+            logger.debug("[Query Expansion] Original: %r -> Expanded: %r", prompt, expanded_prompt)
             return expanded_prompt
         except Exception as e:
-            print(f"  [Query Expansion] Failed: {e}")
+            logger.warning("[Query Expansion] Failed: %s", e)
             return prompt
 
+    def _try_direct(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Answer greetings and bare arithmetic locally; ``None`` means run the agent loop."""
+        if DIRECT_GREETING_RE.match(prompt):
+            return {"answer": DIRECT_GREETING_ANSWER, "tool_outputs": [], "confidence": 1.0}
+
+        match = DIRECT_MATH_RE.match(prompt)
+        if match and "calculator" in self.tools:
+            expression = (match.group("expr") or match.group("expr_eq")).strip()
+            result = self._run_tool("calculator", {"expression": expression})
+            if not result.startswith("Result: "):
+                return None  # e.g. division by zero; let the agent explain
+            return {
+                "answer": f"{expression} = {result[len('Result: '):]}",
+                "tool_outputs": [ToolOutput(
+                    tool_name="calculator",
+                    content=result,
+                    metadata={"args": {"expression": expression}, "thought": "Direct arithmetic."}
+                )],
+                "confidence": 1.0,
+            }
+        return None
+
+    def _system_prompt_parts(self, persona: str) -> tuple[str, str]:
+        """Static text around the per-step history/request/scratchpad, cached per persona."""
+        parts = self._system_prompt_cache.get(persona)
+        if parts is None:
+            prefix = f"""
+{persona}
+
+Available Tools:
+{self.tool_desc_str}
+- parallel: Run several independent tool calls at once (e.g., weather in two cities, two unrelated searches). Arguments: {{calls: [{{"tool": "tool_name", "args": {{...}}}}, ...]}}
+- final_answer: Use this tool when you have the final answer for the user. Arguments: {{text: The final response text}}
+
+IMPORTANT:
+- **EFFICIENCY**: If the user asks a question that you can answer directly with your internal knowledge (e.g., general facts, coding help, jokes, simple math), use the `final_answer` tool IMMEDIATELY. Do NOT use other tools unless necessary.
+- **SIMPLE FACTS**: For simple factual questions (e.g., "Who is the CEO of Apple?", "Capital of France"), prefer the `wikipedia` tool over `web_search`. It is faster and more concise.
+- **INTERNAL KNOWLEDGE**: For philosophical, general knowledge, or conversational queries (e.g., "Meaning of life", "Tell me a joke", "What is 2+2?"), use `final_answer` IMMEDIATELY. Do NOT use tools.
+- **CONCISENESS**: If the user asks a simple question, provide a **concise answer (1-2 sentences)**. Do not write a long essay unless asked.
+- **DIRECTNESS**: Start the answer immediately. Do not say "Here is the answer", "Based on my search", or "I found that". Just state the answer.
+- Your final answer (via the final_answer tool) should be a natural language summary, unless the user explicitly asks for a structured format (like JSON).
+- Do not just dump data; explain it to the user.
+- **Use Markdown tables** when comparing multiple items (e.g., weather in two cities, stock prices).
+- Use **bold headings** to organize long answers.
+- Keep the layout clean, professional, and easy to read.
+- When using information from tools (web_search, get_news, wikipedia), YOU MUST INCLUDE THE SOURCE LINKS/URLS in your final answer.
+- Format citations as: [Source Name](URL) or simply (URL).
+- If a tool provides a URL, make sure it ends up in the final answer so the user can validate it.
+
+SAFETY & CONDUCT:
+- You are a helpful and harmless AI assistant.
+- If the user asks for help with a harmful, illegal, or unethical activity, REFUSE the request politely but firmly.
+- Do not be preachy or judgmental. Simply state that you cannot assist with that specific request.
+- Example Refusal: "I cannot provide instructions on how to make a bomb as that is dangerous and illegal."
+- Do NOT provide "educational" or "theoretical" information for harmful topics if it could be used for harm.
+
+Conversation History:
+"""
+            suffix = """
+Instructions:
+1. Analyze the Request, History, and Previous Steps.
+2. Formulate a "Thought" about what to do next.
+3. Decide the NEXT step: either use a tool to get more info, or provide the final answer.
+4. Return ONLY a JSON object with the following structure:
+{
+  "thought": "Your reasoning here...",
+  "tool": "tool_name",
+  "args": { "arg_name": "value" }
+}
+
+IMPORTANT:
+- Your final answer (via the final_answer tool) should be a natural language summary, unless the user explicitly asks for a structured format (like JSON).
+- Do not just dump data; explain it to the user.
+- **Use Markdown tables** when comparing multiple items (e.g., weather in two cities, stock prices).
+- Use **bold headings** to organize long answers.
+- Keep the layout clean, professional, and easy to read.
+"""
+            parts = self._system_prompt_cache[persona] = (prefix, suffix)
+        return parts
+
     def _calculate_confidence(self, prompt: str, answer: str, tool_outputs: list) -> float:
         """Calculate confidence score (0.0 - 1.0) based on evidence."""
         evidence_text = "\n".join([f"- {t.tool_name}: {t.content[:500]}..." for t in tool_outputs])
@@ -101,22 +283,42 @@ class AgentRouter:
         try:
             response = self.model.generate_content(eval_prompt)
             score = float(response.text.strip())
-            print(f"  [Confidence] Calculated Score: {score}")
+            logger.debug("[Confidence] Calculated Score: %s", score)
             return max(0.0, min(1.0, score))
         except Exception as e:
-            print(f"  [Confidence] Calculation Failed: {e}")
+            logger.warning("[Confidence] Calculation Failed: %s", e)
             return 0.5 # Default fallback
 
+    def _run_tool(self, tool_name: str, tool_args: Any) -> str:
+        """Run a single tool by name, returning an error string for unknown tools."""
+        tool = self.tools.get(tool_name)
+        if tool is None:
+            return f"Error: Tool '{tool_name}' not found."
+        # Pass args directly, let the tool validate
+        return tool.run(tool_args)
+
     def route_and_execute(self, prompt: str, max_steps: int = 20, persona: str = "You are a smart agent that solves problems using tools.") -> Dict[str, Any]:
-        
+        direct = self._try_direct(prompt)
+        if direct is not None:
+            logger.info("Answered directly: %r", prompt)
+            self.chat_history.append({"role": "User", "content": prompt})
+            self.chat_history.append({"role": "Agent", "content": direct["answer"]})
+            return direct
+
         # Expand the query first
         expanded_prompt = self._expand_query(prompt)
-        print(f"--- Processing Prompt: '{expanded_prompt}' ---")
+        logger.info("Processing prompt: %r", expanded_prompt)
         
         self.chat_history.append({"role": "User", "content": expanded_prompt})
         
         scratchpad = []
+        scratchpad_len = 0
+        scratchpad_text = ""
         tool_outputs = []
+        history_len = -1
+        history_text = ""
+        search_count = 0
+        counted_outputs = 0
         
         for step in range(max_steps):
             # --- Loop Detection ---
@@ -128,15 +330,17 @@ class AgentRouter:
                 prev_args = tool_outputs[-2].metadata.get('args')
                 
                 if last_tool == prev_tool and last_args == prev_args:
-                     print(f"  [Loop Detected] Same tool call repeated: {last_tool}({last_args})")
+                     logger.info("[Loop Detected] Same tool call repeated: %s(%s)", last_tool, last_args)
                      # Force the agent to try something else by appending a system message
                      self.chat_history.append({
                          "role": "system",
                          "content": f"SYSTEM ALERT: You just called {last_tool} with {last_args} twice in a row. STOP doing this. Try a DIFFERENT tool or a DIFFERENT query immediately."
                      })
             
-            # Check if we are stuck in a search loop (many search calls with no answer)
-            search_count = sum(1 for h in tool_outputs if h.tool_name in ['web_search', 'get_news', 'wikipedia'])
+            # Check if we are stuck in a search loop (many search calls with no answer);
+            # only outputs added since the previous step need counting
+            search_count += sum(1 for h in islice(tool_outputs, counted_outputs, None) if h.tool_name in SEARCH_TOOLS)
+            counted_outputs = len(tool_outputs)
             if search_count > 5 and step > 8:
                  self.chat_history.append({
                      "role": "system",
@@ -144,76 +348,28 @@ class AgentRouter:
                  })
             # ----------------------
 
-            print(f"  [Step {step + 1}/{max_steps}] Thinking...")
-            
-            history_text = "\n".join([f"{msg['role']}: {msg['content']}" for msg in self.chat_history[:-1]])
-            scratchpad_text = "\n".join(scratchpad)
+            logger.debug("[Step %d/%d] Thinking...", step + 1, max_steps)
             
-            # Generate tool descriptions from Pydantic schemas
-            tool_descriptions = []
-            for t in self.tools.values():
-                schema = t.args_schema.model_json_schema()
-                # Simplified schema representation for the prompt
-                args_desc = ", ".join([f"{k}: {v.get('description', '')} ({v.get('type', 'any')})" for k, v in schema.get('properties', {}).items()])
-                tool_descriptions.append(f"- {t.name}: {t.description} Arguments: {{{args_desc}}}")
+            if len(self.chat_history) != history_len:
+                # Re-render only when entries were added, and only the last few turns
+                history_len = len(self.chat_history)
+                history_text = "\n".join(
+                    f"{msg['role']}: {msg['content']}"
+                    for msg in self.chat_history[-(CHAT_HISTORY_MAX_TURNS + 1):-1]
+                )
+            if len(scratchpad) > scratchpad_len:
+                # Append only the entries added since the previous step
+                new_text = "\n".join(scratchpad[scratchpad_len:])
+                scratchpad_text = f"{scratchpad_text}\n{new_text}" if scratchpad_text else new_text
+                scratchpad_len = len(scratchpad)
             
-            tool_desc_str = "\n".join(tool_descriptions)
-            
-            system_prompt = f"""
-{persona}
-
-Available Tools:
-{tool_desc_str}
-- final_answer: Use this tool when you have the final answer for the user. Arguments: {{text: The final response text}}
-
-IMPORTANT:
-- **EFFICIENCY**: If the user asks a question that you can answer directly with your internal knowledge (e.g., general facts, coding help, jokes, simple math), use the `final_answer` tool IMMEDIATELY. Do NOT use other tools unless necessary.
-- **SIMPLE FACTS**: For simple factual questions (e.g., "Who is the CEO of Apple?", "Capital of France"), prefer the `wikipedia` tool over `web_search`. It is faster and more concise.
-- **INTERNAL KNOWLEDGE**: For philosophical, general knowledge, or conversational queries (e.g., "Meaning of life", "Tell me a joke", "What is 2+2?"), use `final_answer` IMMEDIATELY. Do NOT use tools.
-- **CONCISENESS**: If the user asks a simple question, provide a **concise answer (1-2 sentences)**. Do not write a long essay unless asked.
-- **DIRECTNESS**: Start the answer immediately. Do not say "Here is the answer", "Based on my search", or "I found that". Just state the answer.
-- Your final answer (via the final_answer tool) should be a natural language summary, unless the user explicitly asks for a structured format (like JSON).
-- Do not just dump data; explain it to the user.
-- **Use Markdown tables** when comparing multiple items (e.g., weather in two cities, stock prices).
-- Use **bold headings** to organize long answers.
-- Keep the layout clean, professional, and easy to read.
-- When using information from tools (web_search, get_news, wikipedia), YOU MUST INCLUDE THE SOURCE LINKS/URLS in your final answer.
-- Format citations as: [Source Name](URL) or simply (URL).
-- If a tool provides a URL, make sure it ends up in the final answer so the user can validate it.
-
-SAFETY & CONDUCT:
-- You are a helpful and harmless AI assistant.
-- If the user asks for help with a harmful, illegal, or unethical activity, REFUSE the request politely but firmly.
-- Do not be preachy or judgmental. Simply state that you cannot assist with that specific request.
-- Example Refusal: "I cannot provide instructions on how to make a bomb as that is dangerous and illegal."
-- Do NOT provide "educational" or "theoretical" information for harmful topics if it could be used for harm.
-
-Conversation History:
-{history_text}
-
-Current User Request: {expanded_prompt}
-
-Previous Steps (Scratchpad):
-{scratchpad_text}
-
-Instructions:
-1. Analyze the Request, History, and Previous Steps.
-2. Formulate a "Thought" about what to do next.
-3. Decide the NEXT step: either use a tool to get more info, or provide the final answer.
-4. Return ONLY a JSON object with the following structure:
-{{
-  "thought": "Your reasoning here...",
-  "tool": "tool_name",
-  "args": {{ "arg_name": "value" }}
-}}
-
-IMPORTANT:
-- Your final answer (via the final_answer tool) should be a natural language summary, unless the user explicitly asks for a structured format (like JSON).
-- Do not just dump data; explain it to the user.
-- **Use Markdown tables** when comparing multiple items (e.g., weather in two cities, stock prices).
-- Use **bold headings** to organize long answers.
-- Keep the layout clean, professional, and easy to read.
-"""
+            system_prefix, system_suffix = self._system_prompt_parts(persona)
+            system_prompt = (
+                f"{system_prefix}{history_text}\n\n"
+                f"Current User Request: {expanded_prompt}\n\n"
+                f"Previous Steps (Scratchpad):\n{scratchpad_text}\n"
+                f"{system_suffix}"
+            )
             
             # Retry loop for model generation and parsing
             max_retries = 3
@@ -222,27 +378,19 @@ IMPORTANT:
                     response = self.model.generate_content(system_prompt)
                     response_text = response.text.strip()
                     
-                    # Robust JSON extraction
-                    start_idx = response_text.find('{')
-                    end_idx = response_text.rfind('}')
-                    
-                    if start_idx != -1 and end_idx != -1:
-                        json_str = response_text[start_idx : end_idx + 1]
-                        decision = json.loads(json_str)
-                    else:
-                        raise ValueError("No JSON object found in response")
+                    decision = parse_decision(response_text)
                     
                     thought = decision.get("thought", "No thought provided.")
                     tool_name = decision.get("tool")
                     tool_args = decision.get("args")
                     
-                    print(f"    [Thought] {thought}")
-                    print(f"    -> Decided to use: {tool_name} (Args: {tool_args})")
+                    logger.debug("[Thought] %s", thought)
+                    logger.debug("-> Decided to use: %s (Args: %s)", tool_name, tool_args)
                     
                     break # Success, exit retry loop
                     
                 except Exception as e:
-                    print(f"    [Attempt {attempt+1}/{max_retries}] Error parsing response: {e}")
+                    logger.warning("[Attempt %d/%d] Error parsing response: %s", attempt + 1, max_retries, e)
                     
                     # Try to repair JSON with LLM
                     if attempt < max_retries - 1:
@@ -258,31 +406,31 @@ IMPORTANT:
                             repaired_text = repair_response.text.strip()
                             
                             # Try to extract again from repaired text
-                            start_idx = repaired_text.find('{')
-                            end_idx = repaired_text.rfind('}')
-                            if start_idx != -1 and end_idx != -1:
-                                json_str = repaired_text[start_idx : end_idx + 1]
-                                decision = json.loads(json_str)
-                                
-                                thought = decision.get("thought", "No thought provided.")
-                                tool_name = decision.get("tool")
-                                tool_args = decision.get("args")
-                                print(f"    [JSON Repair] Successfully repaired JSON.")
-                                print(f"    [Thought] {thought}")
-                                print(f"    -> Decided to use: {tool_name} (Args: {tool_args})")
-                                break
+                            decision = parse_decision(repaired_text)
+                            
+                            thought = decision.get("thought", "No thought provided.")
+                            tool_name = decision.get("tool")
+                            tool_args = decision.get("args")
+                            logger.debug("[JSON Repair] Successfully repaired JSON.")
+                            logger.debug("[Thought] %s", thought)
+                            logger.debug("-> Decided to use: %s (Args: %s)", tool_name, tool_args)
+                            break
                         except Exception as repair_error:
-                             print(f"    [JSON Repair] Failed: {repair_error}")
+                             logger.warning("[JSON Repair] Failed: %s", repair_error)
 
                     if attempt == max_retries - 1:
                         tool_name = None # Failed after retries
             
             if not tool_name:
                 error_msg = "Failed to generate valid JSON action after retries."
-                print(f"    -> {error_msg}")
+                logger.warning("-> %s", error_msg)
                 scratchpad.append(f"System Error: {error_msg}")
                 continue
 
+            if isinstance(tool_name, list):
+                # The model sometimes lists several calls under "tool"; run them as one parallel step
+                tool_name, tool_args = "parallel", {"calls": tool_name}
+
             if tool_name == "final_answer":
                 answer_text = tool_args.get("text") if isinstance(tool_args, dict) else str(tool_args)
                 self.chat_history.append({"role": "Agent", "content": answer_text})
@@ -296,15 +444,48 @@ IMPORTANT:
                     "confidence": confidence
                 }
 
+            if tool_name == "parallel":
+                calls = tool_args.get("calls", []) if isinstance(tool_args, dict) else tool_args
+                if not isinstance(calls, list) or not calls:
+                    error_msg = "Error: 'parallel' requires a non-empty list of calls."
+                    logger.warning("-> %s", error_msg)
+                    scratchpad.append(f"System Error: {error_msg}")
+                    continue
+
+                # Each call must name its tool with a string; anything else (e.g. a nested
+                # list from the model) would break the tool lookup for the whole step
+                invalid = [call for call in calls if not (isinstance(call, dict) and isinstance(call.get("tool"), str))]
+                if invalid:
+                    error_msg = f"Error: each 'parallel' call needs a string \"tool\" name; invalid calls: {invalid}"
+                    logger.warning("-> %s", error_msg)
+                    scratchpad.append(f"System Error: {error_msg}")
+                    continue
+
+                calls = [(call["tool"], call.get("args")) for call in calls]
+                # Independent calls are network-bound, so overlap them on a thread pool
+                with ThreadPoolExecutor(max_workers=min(len(calls), MAX_PARALLEL_TOOLS)) as executor:
+                    results = list(executor.map(lambda call: self._run_tool(*call), calls))
+
+                scratchpad.append(f"Thought: {thought}")
+                for (call_name, call_args), result in zip(calls, results):
+                    logger.debug("-> Output (%s): %s", call_name, result)
+                    scratchpad.append(f"Action: Used {call_name} with args '{call_args}'")
+                    scratchpad.append(f"Observation: {truncate_observation(result)}")
+                    if call_name in self.tools:
+                        tool_outputs.append(ToolOutput(
+                            tool_name=call_name,
+                            content=str(result),
+                            metadata={"args": call_args, "thought": thought}
+                        ))
+                continue
+
             if tool_name in self.tools:
-                tool = self.tools[tool_name]
-                # Pass args directly, let the tool validate
-                result = tool.run(tool_args)
-                print(f"    -> Output: {result}")
+                result = self._run_tool(tool_name, tool_args)
+                logger.debug("-> Output: %s", result)
                 
                 scratchpad.append(f"Thought: {thought}")
                 scratchpad.append(f"Action: Used {tool_name} with args '{tool_args}'")
-                scratchpad.append(f"Observation: {result}")
+                scratchpad.append(f"Observation: {truncate_observation(result)}")
                 
                 tool_outputs.append(ToolOutput(
                     tool_name=tool_name,
@@ -313,7 +494,7 @@ IMPORTANT:
                 ))
             else:
                 error_msg = f"Error: Tool '{tool_name}' not found."
-                print(f"    -> {error_msg}")
+                logger.warning("-> %s", error_msg)
                 scratchpad.append(f"System Error: {error_msg}")
         
         fallback_response = "I tried to solve your request but ran out of steps. Please try again."
@@ -325,78 +506,264 @@ IMPORTANT:
         }
 
 
+class ArtifactLog:
+    """Appends run artifacts as JSON lines to LOG_DIR/runs.jsonl.
+
+    Writes happen on a background thread that groups up to ``max_batch`` runs
+    (or whatever arrives within ``max_delay_s``) into a single append.
+    """
+
+    def __init__(self, logs_dir: str, max_batch: int = 100, max_delay_s: float = 0.05) -> None:
+        os.makedirs(logs_dir, exist_ok=True)
+        self.path = os.path.join(logs_dir, "runs.jsonl")
+        self.max_batch = max_batch
+        self.max_delay_s = max_delay_s
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._writer, name="artifact-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def append(self, result: Dict[str, Any]) -> None:
+        # Serialize on the caller's thread so later mutations can't leak into the log
+        self._queue.put(orjson.dumps(result))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending artifacts and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _writer(self) -> None:
+        while True:
+            line = self._queue.get()
+            if line is None:
+                return
+            lines = [line]
+            stop = False
+            deadline = time.monotonic() + self.max_delay_s
+            while len(lines) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    line = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if line is None:
+                    stop = True
+                    break
+                lines.append(line)
+
+            try:
+                with open(self.path, "ab") as fh:
+                    fh.write(b"\n".join(lines) + b"\n")
+                logger.debug("wrote %d run artifact(s) -> %s", len(lines), self.path)
+            except OSError as e:
+                logger.error("failed to write artifacts: %s", e)
+            if stop:
+                return
+
+
+_artifact_log: Optional[ArtifactLog] = None
+_artifact_log_lock = threading.Lock()
+
+
+def get_artifact_log() -> ArtifactLog:
+    """Process-wide artifact log, created on first use."""
+    global _artifact_log
+    with _artifact_log_lock:
+        if _artifact_log is None:
+            _artifact_log = ArtifactLog(os.getenv("LOG_DIR", "./logs"))
+        return _artifact_log
+
+
+# Run status updates append to the runs log under its file lock; apply them off
+# the job's thread, in submission order, so an in_progress write can't land
+# after the job's final one.
+STORE_UPDATES = ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-store")
+
+
+def _log_store_error(future: "Future[Dict[str, Any]]") -> None:
+    error = future.exception()
+    if error is not None:
+        logger.error("failed to update run: %s", error)
+
+
+def update_run_async(run_id: str, **updates: Any) -> "Future[Dict[str, Any]]":
+    """Queue an ``update_run`` on the background store writer."""
+    future = STORE_UPDATES.submit(update_run, run_id, **updates)
+    future.add_done_callback(_log_store_error)
+    return future
+
+
+def prompt_cache_key(prompt: str) -> str:
+    """Normalise whitespace and case so trivially different retypes share an entry."""
+    return " ".join(prompt.split()).lower()
+
+
+class PromptResultCache:
+    """Thread-safe LRU of agent results keyed by normalised prompt text.
+
+    ``max_size`` of 0 disables the cache (``get`` misses, ``put`` is a no-op).
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, prompt: str) -> Optional[Dict[str, Any]]:
+        if not self.max_size:
+            return None
+        key = prompt_cache_key(prompt)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, prompt: str, result: Dict[str, Any]) -> None:
+        if not self.max_size:
+            return
+        key = prompt_cache_key(prompt)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+def build_tools() -> List[Tool]:
+    """Instantiate the default toolbelt used by the agent."""
+    return [
+        TavilySearchTool(),
+        WeatherTool(),
+        CalculatorTool(),
+        TimeTool(),
+        StockPriceTool(),
+        WikipediaTool(),
+        NewsTool()
+    ]
+
+
 class OrchestratorWorker:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        tools: Optional[List[Tool]] = None,
+        result_cache: Optional[PromptResultCache] = None,
+        model_name: str = GEMINI_MODEL,
+    ) -> None:
+        """Create a worker; pass ``tools`` to reuse an already-built toolbelt.
+
+        With ``result_cache``, jobs whose prompt was already answered reuse the
+        cached agent result instead of running the agent loop again.
+        """
         self.gemini_key = os.getenv("GEMINI_API_KEY", "dummy-key")
-        self.tools = [
-            TavilySearchTool(),
-            WeatherTool(),
-            CalculatorTool(),
-            TimeTool(),
-            StockPriceTool(),
-            WikipediaTool(),
-            NewsTool()
-        ]
-        self.agent = AgentRouter(self.tools, self.gemini_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-
-    def run(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        """Main entrypoint for a prompt job."""
+        self.tools = tools if tools is not None else build_tools()
+        self.agent = AgentRouter(self.tools, self.gemini_key, model_name=model_name)
+        # The process-wide model from get_shared_model, so warm_up warms what jobs use
+        self.model = self.agent.model
+        self.result_cache = result_cache
+
+    def warm_up(self) -> None:
+        """Issue a tiny Gemini request on the shared model so DNS, TLS and auth are set up before the first job."""
+        try:
+            self.model.generate_content("ok")
+            logger.info("Gemini connection warmed up")
+        except Exception as e:
+            logger.warning("Gemini warm-up failed: %s", e)
+
+    def run(self, job: Dict[str, Any], update_store: bool = True) -> Dict[str, Any]:
+        """Main entrypoint for a prompt job.
+
+        Pass ``update_store=False`` when the caller persists the finished run
+        itself, so the run is written to storage once instead of three times;
+        otherwise the status updates are queued on the background store writer.
+        """
         run_id = job["run_id"]
         prompt = job["prompt"]
-        update_run(run_id, status="in_progress")
+        if update_store:
+            update_run_async(run_id, status="in_progress")
         
         # Execute Agent Logic
-        agent_result = self.agent.route_and_execute(prompt)
+        agent_result = self.result_cache.get(prompt) if self.result_cache else None
+        if agent_result is None:
+            agent_result = self.agent.route_and_execute(prompt)
+            if self.result_cache:
+                self.result_cache.put(prompt, agent_result)
+        else:
+            logger.info("reusing cached agent result for run_id=%s", run_id)
         final_answer = agent_result["answer"]
         tool_outputs = agent_result["tool_outputs"]
         confidence = agent_result.get("confidence", 0.0)
 
+        tools = [output.asdict() for output in tool_outputs]
         result = {
             "run_id": run_id,
             "prompt": prompt,
-            "tools": [output.__dict__ for output in tool_outputs],
+            "tools": tools,
             "answer": final_answer,
             "confidence": confidence,
             "latency_ms": job.get("latency_ms", 0),
         }
         self._persist_run(result)
-        update_run(
-            run_id,
-            status="awaiting_votes",
-            provisional_answer=final_answer,
-            confidence=confidence,
-            evidence=[output.__dict__ for output in tool_outputs],
-        )
+        if update_store:
+            update_run_async(
+                run_id,
+                status="awaiting_votes",
+                provisional_answer=final_answer,
+                confidence=confidence,
+                evidence=tools,
+            )
         return result
 
     def _persist_run(self, result: Dict[str, Any]) -> None:
-        """Persist run artifacts (local JSON for MVP)."""
-        logs_dir = os.getenv("LOG_DIR", "./logs")
-        os.makedirs(logs_dir, exist_ok=True)
-        filepath = os.path.join(logs_dir, f"{result['run_id']}.json")
-        with open(filepath, "w", encoding="utf-8") as fh:
-            json.dump(result, fh, indent=2)
-        print(f"[orchestrator] wrote artifacts -> {filepath}")
+        """Persist run artifacts (local JSONL for MVP) without blocking the run."""
+        get_artifact_log().append(result)
 
 
-def poll_queue() -> Dict[str, Any] | None:
-    """Pull job from shared JSON queue; sleep when empty."""
-    job = pop_job()
-    if job:
-        return job
-    time.sleep(1)
-    return None
+def poll_queue(max_jobs: int = JOB_BATCH_SIZE, timeout: float = 5.0) -> List[Dict[str, Any]]:
+    """Pull up to ``max_jobs`` from the shared append-only job log, blocking up to ``timeout`` seconds."""
+    return pop_jobs(max_jobs, timeout=timeout)
 
 
 def main() -> None:
-    worker = OrchestratorWorker()
-    while True:
-        job = poll_queue()
-        if not job:
-            continue
-        result = worker.run(job)
-        print(f"[orchestrator] completed run_id={result['run_id']}")
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    )
+    tools = build_tools()
+    result_cache = PromptResultCache(int(os.getenv("PROMPT_CACHE_SIZE", "0")))
+
+    def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+        # Each job gets its own worker (and chat history) but shares the toolbelt
+        return OrchestratorWorker(tools=tools, result_cache=result_cache).run(job)
+
+    # Overlap connection setup with waiting for the first job
+    threading.Thread(target=OrchestratorWorker(tools=tools).warm_up, name="gemini-warm-up", daemon=True).start()
+
+    # Jobs spend nearly all their time waiting on Gemini and tool I/O, so up to
+    # JOB_BATCH_SIZE run side by side. Each finished job frees its slot for the
+    # next queued one instead of holding it until the slowest job in a batch.
+    inflight: Dict[Future, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=JOB_BATCH_SIZE, thread_name_prefix="job") as executor:
+        while True:
+            free = JOB_BATCH_SIZE - len(inflight)
+            if free:
+                for job in poll_queue(free, timeout=JOB_REFILL_POLL_S if inflight else 5.0):
+                    inflight[executor.submit(run_job, job)] = job
+            if not inflight:
+                continue
+            # With every slot busy, block until one frees; otherwise just reap
+            done, _ = wait(inflight, timeout=0 if free else None, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = inflight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error("run_id=%s failed: %s", job.get("run_id"), e)
+                    continue
+                logger.info("completed run_id=%s", result["run_id"])
 
 
 if __name__ == "__main__":
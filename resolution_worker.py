@@ -2,95 +2,129 @@
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import time
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
 
 import sys
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
-from shared.storage import load_runs, update_run, get_run
+from shared.storage import oldest_pending_since, pending_runs, update_runs_bulk, get_run
+from shared.tools import get_tavily_client
 
 SOURCES_PATH = os.path.join(os.path.dirname(__file__), "data", "credible_sources.json")
+# Tavily searches in flight at once during a resolution cycle
+RESOLUTION_CONCURRENCY = int(os.getenv("RESOLUTION_CONCURRENCY", "8"))
+# Claims become eligible for resolution this long after creation, and
+# unverifiable ones are retried this long after each attempt
+CLAIM_MIN_AGE_S = 3600
+# Longest the worker sleeps between checks, so claims submitted by other
+# processes are picked up soon after they become due
+RESOLUTION_POLL_S = 60
+# Credible domains included in each search's site: filter
+SEARCH_MAX_DOMAINS = 5
+
 
 def load_credible_sources() -> Dict[str, List[str]]:
     """Load the credible sources registry."""
     try:
-        with open(SOURCES_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(SOURCES_PATH, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print(f"[resolution] Warning: {SOURCES_PATH} not found")
         return {}
 
 
 SOURCES = load_credible_sources()
-
-
-def get_sources_for_topics(topics: List[str]) -> List[str]:
-    """Map claim topics to credible domains."""
-    domains = []
+# Domains searched when a claim's topics match no category
+GENERAL_FALLBACK = tuple(SOURCES.get("General", []))
+
+# Verdict cues counted in each (lowercased) search result as (confirmation, denial)
+# points. Phrases containing another cue carry its point too ("has been confirmed"
+# also counts "confirmed"; "not true" also counts "true"), matching what separate
+# per-cue scans would count.
+VERDICT_CUE_POINTS = {
+    "confirmed": (1, 0), "verified": (1, 0), "true": (1, 0), "accurate": (1, 0),
+    "correct": (1, 0), "factual": (1, 0), "according to": (1, 0), "sources confirm": (1, 0),
+    "officials say": (1, 0), "is true": (2, 0), "has been confirmed": (2, 0),
+    "false": (0, 1), "fake": (0, 1), "hoax": (0, 1), "misleading": (0, 1),
+    "debunked": (0, 1), "incorrect": (0, 1), "misinformation": (0, 1),
+    "disinformation": (0, 1), "not true": (1, 1), "claim is false": (0, 2),
+    "has been debunked": (0, 2),
+}
+# One alternation, longest cue first so phrases win over the words inside them
+VERDICT_CUE_RE = re.compile(
+    r"\b(?:%s)\b" % "|".join(map(re.escape, sorted(VERDICT_CUE_POINTS, key=len, reverse=True)))
+)
+
+
+# (lowercased category, domains) pairs, normalised once for topic lookups
+SOURCES_BY_KEY_LOWER = tuple((key.lower(), domains) for key, domains in SOURCES.items())
+
+
+@lru_cache(maxsize=512)
+def _domains_for_topics(topics: Tuple[str, ...]) -> Tuple[str, ...]:
+    domains: Dict[str, None] = {}
     for topic in topics:
         topic_lower = topic.lower()
-        for key in SOURCES:
-            if topic_lower in key.lower():
-                domains.extend(SOURCES[key])
-    return list(set(domains))
+        for key_lower, key_domains in SOURCES_BY_KEY_LOWER:
+            if topic_lower in key_lower:
+                domains.update(dict.fromkeys(key_domains))
+    return tuple(domains)
+
+
+def get_sources_for_topics(topics: Sequence[str]) -> Tuple[str, ...]:
+    """Map claim topics to credible domains (deduplicated, in registry order).
+
+    Claims share a handful of topic combinations, so results are memoised.
+    """
+    return _domains_for_topics(tuple(topics))
+
+
+@lru_cache(maxsize=256)
+def site_filter_for(domains: Tuple[str, ...]) -> str:
+    """Tavily ``site:`` filter for a domain tuple; claims on the same topics share one."""
+    return " OR ".join(f"site:{d}" for d in domains)
 
 
 def search_credible_sources(claim_text: str, domains: List[str]) -> Optional[int]:
     """Search credible sources for claim verification.
     
-    Uses Tavily API for web search with domain filtering.
-    Tavily is installed via requirements.txt (tavily-python).
+    Uses the Tavily search API with domain filtering, through the shared tool client
+    (and its pooled HTTP_SESSION).
     
     Returns:
         1 for TRUE (confirmed)
         -1 for FALSE (denied)
         None for UNVERIFIABLE
     """
-    api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key:
+    if not os.getenv("TAVILY_API_KEY"):
         print("[resolution] TAVILY_API_KEY not set, cannot verify claims")
         return None
     
     try:
-        from tavily import TavilyClient
-        client = TavilyClient(api_key=api_key)
-        
-        site_filter = " OR ".join([f"site:{d}" for d in domains[:5]])
+        site_filter = site_filter_for(tuple(domains[:SEARCH_MAX_DOMAINS]))
         query = f"{claim_text} ({site_filter})"
         
-        response = client.search(query, search_depth="advanced", max_results=5)
+        response = get_tavily_client().search(query, search_depth="advanced", max_results=5)
         results = response.get("results", [])
         
         if not results:
             return None
         
-        combined_content = " ".join([r.get("content", "") for r in results]).lower()
-        
-        confirmation_patterns = [
-            r"\b(confirmed|verified|true|accurate|correct|factual)\b",
-            r"\b(according to|sources confirm|officials say)\b",
-            r"\b(is true|has been confirmed)\b"
-        ]
-        
-        denial_patterns = [
-            r"\b(false|fake|hoax|misleading|debunked|incorrect)\b",
-            r"\b(misinformation|disinformation|not true)\b",
-            r"\b(claim is false|has been debunked)\b"
-        ]
-        
-        confirmation_score = sum(
-            len(re.findall(pattern, combined_content))
-            for pattern in confirmation_patterns
-        )
-        denial_score = sum(
-            len(re.findall(pattern, combined_content))
-            for pattern in denial_patterns
-        )
+        # Score each result on its own; no joined copy of all the content
+        confirmation_score = denial_score = 0
+        for result in results:
+            for match in VERDICT_CUE_RE.finditer(result.get("content", "").lower()):
+                confirm, deny = VERDICT_CUE_POINTS[match.group()]
+                confirmation_score += confirm
+                denial_score += deny
         
         if denial_score > confirmation_score and denial_score >= 2:
             return -1
@@ -105,65 +139,79 @@ def search_credible_sources(claim_text: str, domains: List[str]) -> Optional[int
 
 
 def resolve_pending_claims() -> None:
-    """Check and resolve pending claims older than 1 hour."""
-    runs = load_runs()
-    resolved_count = 0
+    """Check and resolve pending claims older than 1 hour (or last checked over 1 hour ago)."""
+    runs = pending_runs(idle_before=time.time() - CLAIM_MIN_AGE_S)
+    pending = []
     
     for run_id, run in runs.items():
-        if run.get("ground_truth") is not None:
-            continue
-        
-        created_str = run.get("created_at")
-        if created_str:
-            try:
-                created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-            except ValueError:
-                created = datetime.now()
-        else:
-            continue
-        
-        age = datetime.now() - created.replace(tzinfo=None)
-        if age < timedelta(hours=1):
-            continue
-        
         topics = run.get("topics", ["General"])
-        sources = get_sources_for_topics(topics)
-        
-        if not sources:
-            sources = SOURCES.get("General", [])
-        
+        sources = get_sources_for_topics(topics) or GENERAL_FALLBACK
         if not sources:
             continue
         
         print(f"[resolution] Checking claim {run_id}: {run.get('prompt', '')[:50]}...")
-        verdict = search_credible_sources(run["prompt"], sources)
-        
+        pending.append((run_id, run["prompt"], sources))
+    
+    if not pending:
+        return
+    
+    # Tavily has no multi-query endpoint, so search each distinct (claim, domains)
+    # pair once per cycle (resubmitted claims share a verdict) and overlap the
+    # round-trips
+    searches = list(dict.fromkeys(
+        (claim_text, tuple(sources[:SEARCH_MAX_DOMAINS])) for _, claim_text, sources in pending
+    ))
+    with ThreadPoolExecutor(max_workers=min(len(searches), RESOLUTION_CONCURRENCY)) as executor:
+        search_verdicts = dict(zip(
+            searches,
+            executor.map(lambda search: search_credible_sources(search[0], list(search[1])), searches),
+        ))
+    verdicts = [
+        search_verdicts[(claim_text, tuple(sources[:SEARCH_MAX_DOMAINS]))]
+        for _, claim_text, sources in pending
+    ]
+    
+    resolved_count = 0
+    updates = {}
+    for (run_id, _, _), verdict in zip(pending, verdicts):
+        resolved_at = datetime.now()
         if verdict is not None:
-            update_run(
-                run_id,
-                ground_truth=verdict,
-                status="verified",
-                resolved_at=datetime.now().isoformat(),
-                resolved_by="moderator_agent"
-            )
+            updates[run_id] = {
+                "ground_truth": verdict,
+                "status": "verified",
+                "resolved_at": resolved_at.isoformat(),
+                "resolved_at_epoch": resolved_at.timestamp(),
+                "resolved_by": "moderator_agent",
+            }
             resolved_count += 1
             print(f"[resolution] Resolved {run_id}: {'TRUE' if verdict == 1 else 'FALSE'}")
         else:
-            update_run(
-                run_id,
-                ground_truth=None,
-                status="unverifiable",
-                resolved_at=datetime.now().isoformat(),
-                resolved_by="moderator_agent"
-            )
+            updates[run_id] = {
+                "ground_truth": None,
+                "status": "unverifiable",
+                "resolved_at": resolved_at.isoformat(),
+                "resolved_at_epoch": resolved_at.timestamp(),
+                "resolved_by": "moderator_agent",
+            }
             print(f"[resolution] Marked {run_id} as unverifiable")
     
+    # One storage write for the whole cycle
+    update_runs_bulk(updates)
+    
     if resolved_count > 0:
         print(f"[resolution] Resolved {resolved_count} claims this cycle")
 
 
+def seconds_until_next_due() -> float:
+    """Time until the next pending claim becomes due, capped at RESOLUTION_POLL_S."""
+    oldest = oldest_pending_since()
+    if oldest is None:
+        return RESOLUTION_POLL_S
+    return min(RESOLUTION_POLL_S, max(1.0, oldest + CLAIM_MIN_AGE_S - time.time()))
+
+
 def main() -> None:
-    """Main loop - runs hourly."""
+    """Main loop - resolves claims as they become due."""
     print("[resolution] Starting moderator resolution worker...")
     print(f"[resolution] Loaded {len(SOURCES)} source categories")
     
@@ -172,9 +220,11 @@ def main() -> None:
             resolve_pending_claims()
         except Exception as e:
             print(f"[resolution] Error in resolution cycle: {e}")
+            # The due claims are still due; back off rather than retrying them every second
+            time.sleep(RESOLUTION_POLL_S)
+            continue
         
-        print("[resolution] Sleeping for 1 hour...")
-        time.sleep(3600)
+        time.sleep(seconds_until_next_due())
 
 
 if __name__ == "__main__":
@@ -1,20 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from duckduckgo_search import DDGS
-import json
+
+REGIONS = ("in-en", "us-en", "wt-wt")
 
 def test_search(query, region='in-en'):
-    print(f"--- Testing '{query}' with region='{region}' ---")
+    # Collect the report instead of printing so concurrent searches don't interleave
+    lines = [f"--- Testing '{query}' with region='{region}' ---"]
     try:
         with DDGS() as ddgs:
             results = list(ddgs.text(query, region=region, max_results=3))
             if results:
                 for r in results:
-                    print(f"- {r['title']}: {r['href']}")
+                    lines.append(f"- {r['title']}: {r['href']}")
             else:
-                print("No results found.")
+                lines.append("No results found.")
     except Exception as e:
-        print(f"Error: {e}")
+        lines.append(f"Error: {e}")
+    return "\n".join(lines)
 
 print("Testing DuckDuckGo Search...")
-test_search("Donald Trump last foreign visit", region="in-en")
-test_search("Donald Trump last foreign visit", region="us-en")
-test_search("Donald Trump last foreign visit", region="wt-wt")
+# Regions are independent round-trips; run them together and print in order
+with ThreadPoolExecutor(max_workers=len(REGIONS)) as executor:
+    for report in executor.map(lambda region: test_search("Donald Trump last foreign visit", region=region), REGIONS):
+        print(report)
@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import os
 from typing import List
 
+import orjson
+
 try:
-    from pymongo import MongoClient
+    from pymongo import MongoClient, UpdateOne
 except ImportError:  # pragma: no cover - optional dependency for skeleton
     MongoClient = None  # type: ignore
+    UpdateOne = None  # type: ignore
 
 
 def load_personas() -> List[dict]:
     data_path = os.path.join(os.path.dirname(__file__), "..", "data", "mock_users.json")
-    with open(data_path, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+    with open(data_path, "rb") as fh:
+        return orjson.loads(fh.read())
 
 
 def seed_mongo(uri: str, personas: List[dict]) -> None:
@@ -26,8 +28,12 @@ def seed_mongo(uri: str, personas: List[dict]) -> None:
     client = MongoClient(uri)
     db = client.get_default_database()
     collection = db["users"]
-    for persona in personas:
-        collection.update_one({"user_id": persona["user_id"]}, {"$set": persona}, upsert=True)
+    # One round-trip for all upserts instead of one per persona
+    if personas:
+        collection.bulk_write(
+            [UpdateOne({"user_id": persona["user_id"]}, {"$set": persona}, upsert=True) for persona in personas],
+            ordered=False,
+        )
     print(f"Seeded {len(personas)} personas into MongoDB ({db.name}.users).")
 
 
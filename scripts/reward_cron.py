@@ -2,38 +2,38 @@
 
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from typing import List
 
+import orjson
 
-@dataclass
+# Minimum points for each tier above Bronze, ascending; TIERS[i] covers
+# points in [TIER_THRESHOLDS[i-1], TIER_THRESHOLDS[i])
+TIER_THRESHOLDS = (150, 250, 400)
+TIERS = ("Bronze", "Silver", "Gold", "Platinum")
+
+
+@dataclass(slots=True)
 class UserStat:
     user_id: str
     name: str
     precision: float
     attempts: int
+    # Derived once at construction instead of on every sort key / print access
+    points: int = field(init=False)
+    tier: str = field(init=False)
 
-    @property
-    def points(self) -> int:
-        return int(self.precision * 100 * min(self.attempts, 5))
-
-    @property
-    def tier(self) -> str:
-        if self.points >= 400:
-            return "Platinum"
-        if self.points >= 250:
-            return "Gold"
-        if self.points >= 150:
-            return "Silver"
-        return "Bronze"
+    def __post_init__(self) -> None:
+        self.points = int(self.precision * 100 * min(self.attempts, 5))
+        self.tier = TIERS[bisect_right(TIER_THRESHOLDS, self.points)]
 
 
 def load_user_stats() -> List[UserStat]:
     path = os.path.join(os.path.dirname(__file__), "..", "data", "mock_users.json")
-    with open(path, "r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+    with open(path, "rb") as fh:
+        raw = orjson.loads(fh.read())
     return [UserStat(user_id=item["user_id"], name=item["name"], precision=item["precision"], attempts=item["attempts"]) for item in raw]
 
 
@@ -0,0 +1,40 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from shared.tools import safe_eval
+
+# Expressions that must be refused quickly instead of hanging the worker
+OVERSIZED = [
+    "9**9**9",
+    "((9**999)**999)**999",
+    "(2**5000)**5000",
+]
+# Ordinary arithmetic that must still evaluate like eval would
+ORDINARY = ["2+2", " 2- 2", "(3 * 4) / 2", "2**10", "7 // 2", "9**999 % 7", "-3**2"]
+
+def test_calculator():
+    passed = True
+    for expression in OVERSIZED:
+        start = time.monotonic()
+        try:
+            safe_eval(expression)
+            print(f"FAILED: '{expression}' was evaluated")
+            passed = False
+        except ValueError as e:
+            elapsed = time.monotonic() - start
+            ok = elapsed < 1.0
+            passed &= ok
+            print(f"{'PASSED' if ok else 'FAILED'}: '{expression}' refused ({e}) in {elapsed:.3f}s")
+
+    for expression in ORDINARY:
+        expected = eval(expression, {"__builtins__": None}, {})
+        result = safe_eval(expression)
+        ok = result == expected
+        passed &= ok
+        print(f"{'PASSED' if ok else 'FAILED'}: '{expression}' = {result}")
+
+    print("ALL PASSED" if passed else "SOME CHECKS FAILED")
+
+if __name__ == "__main__":
+    test_calculator()
@@ -1,17 +1,16 @@
 import re
 
+# Regex to remove "Sources:" or "References:" block at the end
+# Matches:
+# \n+          : One or more newlines
+# (\*\*|#+)?   : Optional bold or header marker
+# (Sources|References|Citations) : Keyword
+# .*           : Everything after (dotall)
+# We use re.DOTALL to match newlines in the "everything after" part
+SOURCES_BLOCK_RE = re.compile(r"\n+(\*\*|#+\s)?(Sources|References|Citations).*?(\Z)", re.DOTALL | re.IGNORECASE)
+
 def clean_answer(text):
-    # Regex to remove "Sources:" or "References:" block at the end
-    # Matches:
-    # \n+          : One or more newlines
-    # (\*\*|#+)?   : Optional bold or header marker
-    # (Sources|References|Citations) : Keyword
-    # .*           : Everything after (dotall)
-    
-    pattern = r"\n+(\*\*|#+\s)?(Sources|References|Citations).*?(\Z)"
-    
-    # We use re.DOTALL to match newlines in the "everything after" part
-    cleaned = re.sub(pattern, "", text, flags=re.DOTALL | re.IGNORECASE)
+    cleaned = SOURCES_BLOCK_RE.sub("", text)
     return cleaned.strip()
 
 sample_text = """The CEO of Apple is Tim Cook.
@@ -7,7 +7,13 @@ from typing import Iterable, Mapping
 
 def compute_confidence(votes: Iterable[Mapping[str, float]]) -> float:
     """Return weighted confidence score between 0 and 1."""
-    weighted = sum(v["vote"] * v["weight"] for v in votes)
-    max_weight = sum(abs(v["weight"]) for v in votes) or 1
+    # Single pass, so a one-shot iterator of votes is handled correctly too
+    weighted = 0.0
+    max_weight = 0.0
+    for v in votes:
+        weight = v["weight"]
+        weighted += v["vote"] * weight
+        max_weight += abs(weight)
+    max_weight = max_weight or 1
     normalized = (weighted / max_weight + 1) / 2  # map [-1,1] -> [0,1]
     return round(normalized, 3)
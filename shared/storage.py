@@ -1,74 +1,393 @@
-"""Simple JSON-file backed storage for runs and job queue."""
+"""Simple JSON-file backed storage for runs and job queue (append-only logs)."""
 
 from __future__ import annotations
 
-import json
+import fcntl
 import os
 import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple
+
+import orjson
 
 DATA_DIR = Path(os.getenv("DATA_DIR", "./data/state"))
-RUNS_FILE = DATA_DIR / "runs.json"
-JOBS_FILE = DATA_DIR / "jobs.json"
+# Append-only log of run writes; replayed once, then followed incrementally
+RUNS_FILE = DATA_DIR / "runs.jsonl"
+# Pre-log snapshot ({run_id: run}); imported into RUNS_FILE on first use
+LEGACY_RUNS_FILE = DATA_DIR / "runs.json"
+RUNS_LOCK_FILE = DATA_DIR / "runs.lock"
+# Rewrite the log once it holds this many records per live run
+RUNS_COMPACT_RATIO = 4
+RUNS_COMPACT_MIN_RECORDS = 1000
+# Append-only queue log: "push" records carry a job, "pop" records consume the
+# oldest ``count`` jobs
+JOBS_FILE = DATA_DIR / "jobs.jsonl"
+# Pre-log queue (a JSON list of jobs); imported into JOBS_FILE on first use
+LEGACY_JOBS_FILE = DATA_DIR / "jobs.json"
+# Advisory lock serialising queue appends across processes (LOCK is per process)
+JOBS_LOCK_FILE = DATA_DIR / "jobs.lock"
+# Rewrite the queue log once it holds this many records per queued job
+JOBS_COMPACT_RATIO = 4
+JOBS_COMPACT_MIN_RECORDS = 1000
 LOCK = threading.Lock()
+# Signalled by enqueue_job so blocked pop_job callers wake without polling
+JOBS_READY = threading.Condition(LOCK)
+JOB_POLL_INTERVAL_S = 0.1
+# Signalled on every runs-log append so wait_for_runs_change returns without polling
+RUNS_CHANGED = threading.Condition(LOCK)
+# How often wait_for_runs_change checks for appends made by other processes
+RUNS_POLL_INTERVAL_S = 0.25
+
+# In-process view of RUNS_FILE: runs replayed so far, the byte offset and inode
+# they were read up to, and how many records the file holds
+_runs: Dict[str, Dict[str, Any]] = {}
+_runs_offset = 0
+_runs_inode: Optional[int] = None
+_runs_records = 0
+# Unresolved runs (ground_truth is None) -> epoch seconds of their creation or
+# latest resolution attempt, maintained alongside _runs so pending claims are
+# found without a full scan
+_pending_since: Dict[str, float] = {}
+# Fields whose change can move a run in, out of or within _pending_since. Writers
+# store *_epoch alongside the ISO timestamps so they need no parsing here; the
+# ISO strings are only parsed for runs written before the epochs existed.
+_PENDING_FIELDS = ("ground_truth", "created_at", "created_at_epoch", "resolved_at", "resolved_at_epoch")
+
+# Set once _ensure_files has created both logs in this process
+_files_ready = False
+
+# In-process view of JOBS_FILE, followed the same way as _runs
+_jobs: Deque[Dict[str, Any]] = deque()
+_jobs_offset = 0
+_jobs_inode: Optional[int] = None
+_jobs_records = 0
 
 
 def _ensure_files() -> None:
+    """Create (or migrate) the state files once per process.
+
+    The logs are only ever swapped atomically by compaction, never removed,
+    so later calls skip the mkdir and exists() checks.
+    """
+    global _files_ready
+    if _files_ready:
+        return
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     if not RUNS_FILE.exists():
-        RUNS_FILE.write_text(json.dumps({}, indent=2))
+        with _file_lock(RUNS_LOCK_FILE):
+            if not RUNS_FILE.exists():
+                legacy = orjson.loads(LEGACY_RUNS_FILE.read_bytes()) if LEGACY_RUNS_FILE.exists() else {}
+                _write_runs_snapshot(legacy)
     if not JOBS_FILE.exists():
-        JOBS_FILE.write_text(json.dumps([], indent=2))
+        with _file_lock(JOBS_LOCK_FILE):
+            if not JOBS_FILE.exists():
+                legacy = orjson.loads(LEGACY_JOBS_FILE.read_bytes()) if LEGACY_JOBS_FILE.exists() else []
+                _write_jobs_snapshot(legacy)
+    _files_ready = True
 
 
-def load_runs() -> Dict[str, Dict[str, Any]]:
-    _ensure_files()
-    return json.loads(RUNS_FILE.read_text())
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive flock on ``path`` to serialise writers across processes."""
+    with open(path, "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _run_record(op: str, run_id: str, data: Dict[str, Any]) -> bytes:
+    return orjson.dumps({"op": op, "run_id": run_id, "data": data}, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _read_log(fh: BinaryIO, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Records in the open log ``fh`` after ``offset``, and the bytes they span.
+
+    A partially written trailing record is left for the next read.
+    """
+    fh.seek(offset)
+    chunk = fh.read()
+    end = chunk.rfind(b"\n") + 1
+    return [orjson.loads(line) for line in chunk[:end].splitlines() if line], end
+
+
+def _iso_epoch(timestamp: Any) -> Optional[float]:
+    """Parse a run's ISO timestamp (naive local time) to epoch seconds."""
+    if not timestamp or not isinstance(timestamp, str):
+        return None
+    try:
+        created = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return created.replace(tzinfo=None).timestamp()
+
+
+def _run_epoch(run: Dict[str, Any], field: str) -> Optional[float]:
+    """Epoch seconds of a run timestamp, from ``<field>_epoch`` when the writer stored it."""
+    epoch = run.get(f"{field}_epoch")
+    return epoch if epoch is not None else _iso_epoch(run.get(field))
+
 
+def _apply_run_record(record: Dict[str, Any]) -> None:
+    run_id = record["run_id"]
+    data = record["data"]
+    if record["op"] == "put":
+        run = _runs[run_id] = data
+    else:
+        # Copy-on-write so dicts handed out earlier stay unchanged
+        run = _runs[run_id] = {**_runs.get(run_id, {}), **data}
+        if not any(field in data for field in _PENDING_FIELDS):
+            return
+    created = _run_epoch(run, "created_at") if run.get("ground_truth") is None else None
+    if created is None:
+        _pending_since.pop(run_id, None)
+    else:
+        _pending_since[run_id] = max(created, _run_epoch(run, "resolved_at") or created)
 
-def save_runs(runs: Dict[str, Dict[str, Any]]) -> None:
+
+def _write_runs_snapshot(runs: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically replace RUNS_FILE with one ``put`` record per run."""
+    tmp = RUNS_FILE.with_suffix(".jsonl.tmp")
+    with open(tmp, "wb") as fh:
+        fh.writelines(_run_record("put", run_id, run) for run_id, run in runs.items())
+    os.replace(tmp, RUNS_FILE)
+
+
+def _sync_runs() -> None:
+    """Bring the in-process view up to date with RUNS_FILE (caller holds LOCK).
+
+    Records appended since the last sync, by this or any other process, are
+    read and applied; a replaced file (compaction) is replayed from the start.
+    """
+    global _runs_offset, _runs_inode, _runs_records
     _ensure_files()
-    RUNS_FILE.write_text(json.dumps(runs, indent=2))
+    # Stat the handle we read from, so a compaction swapping the file in
+    # between cannot pair one file's inode and size with another's contents
+    with open(RUNS_FILE, "rb") as fh:
+        stat = os.fstat(fh.fileno())
+        if stat.st_ino != _runs_inode or stat.st_size < _runs_offset:
+            _runs.clear()
+            _pending_since.clear()
+            _runs_offset = 0
+            _runs_records = 0
+            _runs_inode = stat.st_ino
+        if stat.st_size == _runs_offset:
+            return
+        records, consumed = _read_log(fh, _runs_offset)
+    for record in records:
+        _apply_run_record(record)
+    _runs_records += len(records)
+    _runs_offset += consumed
+
+
+def _append_runs(records: List[Dict[str, Any]]) -> None:
+    """Append records to the log and apply them (caller holds LOCK)."""
+    global _runs_offset, _runs_records
+    _ensure_files()  # before taking the file lock, which creating RUNS_FILE also needs
+    with _file_lock(RUNS_LOCK_FILE):
+        _sync_runs()
+        data = b"".join(_run_record(r["op"], r["run_id"], r["data"]) for r in records)
+        with open(RUNS_FILE, "ab") as fh:
+            fh.write(data)
+        for record in records:
+            _apply_run_record(record)
+        _runs_offset += len(data)
+        _runs_records += len(records)
+        if _runs_records > max(RUNS_COMPACT_MIN_RECORDS, RUNS_COMPACT_RATIO * len(_runs)):
+            _compact_runs()
+    RUNS_CHANGED.notify_all()
+
+
+def _compact_runs() -> None:
+    """Rewrite the log as one record per run (caller holds LOCK and the file lock)."""
+    global _runs_offset, _runs_inode, _runs_records
+    _write_runs_snapshot(_runs)
+    stat = RUNS_FILE.stat()
+    _runs_offset, _runs_inode, _runs_records = stat.st_size, stat.st_ino, len(_runs)
+
+
+def load_runs() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of all runs. Run dicts are shared: change them via update_run."""
+    with LOCK:
+        _sync_runs()
+        return dict(_runs)
+
+
+def pending_runs(idle_before: float) -> Dict[str, Dict[str, Any]]:
+    """Unresolved runs (no ground_truth) not created or checked since the epoch ``idle_before``."""
+    with LOCK:
+        _sync_runs()
+        return {run_id: _runs[run_id] for run_id, since in _pending_since.items() if since <= idle_before}
+
+
+def oldest_pending_since() -> Optional[float]:
+    """Earliest creation/last-check epoch among unresolved runs, or None if there are none."""
+    with LOCK:
+        _sync_runs()
+        return min(_pending_since.values(), default=None)
 
 
 def create_run(run_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     with LOCK:
-        runs = load_runs()
-        runs[run_id] = payload
-        save_runs(runs)
+        _append_runs([{"op": "put", "run_id": run_id, "data": payload}])
         return payload
 
 
+def create_runs_bulk(payloads: Dict[str, Dict[str, Any]]) -> None:
+    """Insert many runs with a single append to the runs log."""
+    if not payloads:
+        return
+    with LOCK:
+        _append_runs([{"op": "put", "run_id": run_id, "data": payload} for run_id, payload in payloads.items()])
+
+
 def update_run(run_id: str, **updates: Any) -> Dict[str, Any]:
     with LOCK:
-        runs = load_runs()
-        run = runs.get(run_id, {})
-        run.update(updates)
-        runs[run_id] = run
-        save_runs(runs)
-        return run
+        _append_runs([{"op": "patch", "run_id": run_id, "data": updates}])
+        return _runs[run_id]
+
+
+def update_runs_bulk(updates: Dict[str, Dict[str, Any]]) -> None:
+    """Apply ``{run_id: fields}`` updates with a single append to the runs log."""
+    if not updates:
+        return
+    with LOCK:
+        _append_runs([{"op": "patch", "run_id": run_id, "data": fields} for run_id, fields in updates.items()])
+
+
+def runs_version() -> Tuple[int, int]:
+    """Cheap change token for the runs log: any write changes (mtime_ns, size)."""
+    _ensure_files()
+    stat = RUNS_FILE.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def wait_for_runs_change(version: Optional[Tuple[int, int]], timeout: float) -> bool:
+    """Block until runs_version() differs from ``version`` or ``timeout`` seconds pass.
+
+    Writers in this process wake the waiter immediately; appends by other
+    processes are noticed within RUNS_POLL_INTERVAL_S. Returns whether the
+    runs log changed.
+    """
+    deadline = time.monotonic() + timeout
+    with RUNS_CHANGED:
+        while True:
+            if runs_version() != version:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            RUNS_CHANGED.wait(min(remaining, RUNS_POLL_INTERVAL_S))
 
 
 def get_run(run_id: str) -> Optional[Dict[str, Any]]:
-    runs = load_runs()
-    return runs.get(run_id)
+    with LOCK:
+        _sync_runs()
+        return _runs.get(run_id)
+
+
+def _job_record(record: Dict[str, Any]) -> bytes:
+    return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _apply_job_record(record: Dict[str, Any]) -> None:
+    if record["op"] == "push":
+        _jobs.append(record["job"])
+    else:
+        for _ in range(min(record["count"], len(_jobs))):
+            _jobs.popleft()
+
+
+def _write_jobs_snapshot(jobs: List[Dict[str, Any]]) -> None:
+    """Atomically replace JOBS_FILE with one ``push`` record per queued job."""
+    tmp = JOBS_FILE.with_suffix(".jsonl.tmp")
+    with open(tmp, "wb") as fh:
+        fh.writelines(_job_record({"op": "push", "job": job}) for job in jobs)
+    os.replace(tmp, JOBS_FILE)
+
+
+def _sync_jobs() -> None:
+    """Bring the in-process queue up to date with JOBS_FILE (caller holds LOCK)."""
+    global _jobs_offset, _jobs_inode, _jobs_records
+    _ensure_files()
+    # As in _sync_runs, check and read the same open file
+    with open(JOBS_FILE, "rb") as fh:
+        stat = os.fstat(fh.fileno())
+        if stat.st_ino != _jobs_inode or stat.st_size < _jobs_offset:
+            _jobs.clear()
+            _jobs_offset = 0
+            _jobs_records = 0
+            _jobs_inode = stat.st_ino
+        if stat.st_size == _jobs_offset:
+            return
+        records, consumed = _read_log(fh, _jobs_offset)
+    for record in records:
+        _apply_job_record(record)
+    _jobs_records += len(records)
+    _jobs_offset += consumed
+
+
+def _append_job_record(record: Dict[str, Any]) -> None:
+    """Append one record to the queue log and apply it (caller holds LOCK and the file lock)."""
+    global _jobs_offset, _jobs_inode, _jobs_records
+    _sync_jobs()
+    data = _job_record(record)
+    with open(JOBS_FILE, "ab") as fh:
+        fh.write(data)
+    _apply_job_record(record)
+    _jobs_offset += len(data)
+    _jobs_records += 1
+    if _jobs_records > max(JOBS_COMPACT_MIN_RECORDS, JOBS_COMPACT_RATIO * len(_jobs)):
+        _write_jobs_snapshot(list(_jobs))
+        stat = JOBS_FILE.stat()
+        _jobs_offset, _jobs_inode, _jobs_records = stat.st_size, stat.st_ino, len(_jobs)
 
 
 def enqueue_job(job: Dict[str, Any]) -> None:
-    with LOCK:
+    with JOBS_READY:
         _ensure_files()
-        jobs = json.loads(JOBS_FILE.read_text())
-        jobs.append(job)
-        JOBS_FILE.write_text(json.dumps(jobs, indent=2))
+        with _file_lock(JOBS_LOCK_FILE):
+            _append_job_record({"op": "push", "job": job})
+        JOBS_READY.notify_all()
 
 
-def pop_job() -> Optional[Dict[str, Any]]:
-    with LOCK:
-        _ensure_files()
-        jobs: List[Dict[str, Any]] = json.loads(JOBS_FILE.read_text())
-        if not jobs:
-            return None
-        job = jobs.pop(0)
-        JOBS_FILE.write_text(json.dumps(jobs, indent=2))
-        return job
+def _pop_jobs_locked(max_jobs: int) -> List[Dict[str, Any]]:
+    _sync_jobs()
+    if not _jobs:
+        # Nothing queued as of the last append; skip the file lock
+        return []
+    with _file_lock(JOBS_LOCK_FILE):
+        _sync_jobs()
+        popped = [_jobs[i] for i in range(min(max_jobs, len(_jobs)))]
+        if popped:
+            _append_job_record({"op": "pop", "count": len(popped)})
+    return popped
+
+
+def pop_jobs(max_jobs: int, timeout: float = 0.0) -> List[Dict[str, Any]]:
+    """Pop up to ``max_jobs`` oldest jobs with a single append to the queue log.
+
+    Waits up to ``timeout`` seconds for at least one job, then returns whatever
+    is queued without waiting for the batch to fill. Producers in this process
+    wake the waiter immediately; jobs enqueued by other processes are picked up
+    within JOB_POLL_INTERVAL_S.
+    """
+    deadline = time.monotonic() + timeout
+    with JOBS_READY:
+        while True:
+            jobs = _pop_jobs_locked(max_jobs)
+            remaining = deadline - time.monotonic()
+            if jobs or remaining <= 0:
+                return jobs
+            JOBS_READY.wait(min(remaining, JOB_POLL_INTERVAL_S))
+
+
+def pop_job(timeout: float = 0.0) -> Optional[Dict[str, Any]]:
+    """Pop the oldest job, waiting up to ``timeout`` seconds for one to arrive."""
+    jobs = pop_jobs(1, timeout)
+    return jobs[0] if jobs else None
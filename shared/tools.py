@@ -1,47 +1,220 @@
+import ast
 import datetime
+import functools
+import operator
+import os
+import re
+import threading
+import time
+import unicodedata
 import requests
 import json
-import wikipedia
 import yfinance as yf
 from duckduckgo_search import DDGS
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
 from pydantic import BaseModel, Field, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout for plain HTTP tool calls
+HTTP_TIMEOUT_S = (3, 5)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies HTTP_TIMEOUT_S to requests sent without a timeout.
+
+    requests waits forever by default, which would stall the agent on a hung
+    upstream. Mounted with a short retry policy for transient connection errors.
+    """
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = HTTP_TIMEOUT_S
+        return super().send(request, **kwargs)
+
+
+# Shared by every tool instance so repeated calls reuse pooled keep-alive
+# connections instead of a fresh TCP + TLS handshake per request
+HTTP_SESSION = requests.Session()
+for _prefix in ("https://", "http://"):
+    HTTP_SESSION.mount(
+        _prefix,
+        TimeoutHTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.2)),
+    )
+
+# Tool results kept per process across all network tools (0 disables caching)
+TOOL_CACHE_SIZE = int(os.getenv("TOOL_CACHE_SIZE", "1024"))
+# How long a result stays fresh, per tool
+WIKIPEDIA_CACHE_TTL_S = 24 * 3600
+WEB_SEARCH_CACHE_TTL_S = 10 * 60
+NEWS_CACHE_TTL_S = 5 * 60
+WEATHER_CACHE_TTL_S = 10 * 60
+STOCK_CACHE_TTL_S = 30
+GEOCODE_CACHE_TTL_S = 30 * 24 * 3600
+# Prefix of results served past their TTL because the live call failed
+STALE_RESULT_MARKER = "[cached] "
+
+
+class ToolResultCache:
+    """Thread-safe LRU of tool results that go stale ``ttl`` seconds after being stored.
+
+    Stale entries are kept (until evicted) as a fallback for failed calls.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        """Return ``(result, fresh)``; ``(None, False)`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            expires_at, result = entry
+            return result, time.monotonic() < expires_at
+
+    def put(self, key: Hashable, result: Any, ttl: float) -> None:
+        if not self.max_size:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+TOOL_RESULT_CACHE = ToolResultCache(TOOL_CACHE_SIZE)
+# City -> geocoding result; places don't move, so these outlive the weather itself
+GEOCODE_CACHE = ToolResultCache(TOOL_CACHE_SIZE)
+
+
+def _args_key(value: Any) -> Hashable:
+    """Hashable, case- and whitespace-insensitive key for JSON-like tool arguments."""
+    if isinstance(value, str):
+        return value.strip().lower()
+    if isinstance(value, dict):
+        return tuple(sorted((key, _args_key(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_args_key(item) for item in value)
+    return value
+
+
+def _is_error_result(result: str) -> bool:
+    return result.startswith(("Error", "Argument Validation Error"))
+
+
+def cached_tool(ttl_s: float) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Cache a tool's ``run`` in TOOL_RESULT_CACHE, keyed by tool name and normalised args.
+
+    Error results are never cached; when the live call fails, a stale result for
+    the same arguments is returned instead, prefixed with STALE_RESULT_MARKER.
+    """
+
+    def decorate(run: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(run)
+        def wrapper(self: "Tool", args: Any) -> str:
+            key = (self.name, _args_key(args))
+            cached, fresh = TOOL_RESULT_CACHE.get(key)
+            if fresh:
+                print(f"  [Tool] Cache hit for {self.name}")
+                return cached
+            result = run(self, args)
+            if not _is_error_result(result):
+                TOOL_RESULT_CACHE.put(key, result, ttl_s)
+            elif cached is not None:
+                return STALE_RESULT_MARKER + cached
+            return result
+
+        return wrapper
+
+    return decorate
+
 
 class Tool:
     def __init__(self, name: str, description: str, args_schema: Type[BaseModel]):
         self.name = name
         self.description = description
         self.args_schema = args_schema
+        # Name of the schema's only field, or None when it has zero or several
+        fields = args_schema.model_fields
+        self._single_field: Optional[str] = next(iter(fields)) if len(fields) == 1 else None
 
     def run(self, args: Any) -> str:
         raise NotImplementedError
 
     def validate_args(self, args: Any) -> BaseModel:
-        if isinstance(args, str):
-            # Attempt to handle single string argument if the schema has only one field
-            fields = self.args_schema.model_fields
-            if len(fields) == 1:
-                key = next(iter(fields))
-                return self.args_schema(**{key: args})
-            else:
-                 # If it's a JSON string, try to parse it (though the agent usually gives us a dict or a direct string)
-                 # For now, let's assume if it's a string and we have multiple fields, it might be an error or need parsing.
-                 # But our current agent extracts "args" which can be a string.
-                 pass
-        
+        # A bare (non-dict) value, e.g. the string the agent often passes, fills a single-field schema
+        if self._single_field is not None and not isinstance(args, dict):
+            return self.args_schema.model_validate({self._single_field: args})
         if isinstance(args, dict):
-             return self.args_schema(**args)
-        
-        # Fallback for single argument passed directly
-        # This is a bit loose, but helps with the current agent implementation
-        fields = self.args_schema.model_fields
-        if len(fields) == 1:
-             key = next(iter(fields))
-             return self.args_schema(**{key: args})
-             
+            return self.args_schema.model_validate(args)
         raise ValueError(f"Invalid arguments for tool {self.name}: {args}")
 
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+TAVILY_TIMEOUT_S = 30
+
+
+class TavilyClient:
+    """Minimal Tavily search client over the pooled HTTP_SESSION.
+
+    The SDK client opens a new connection for every search; this one keeps
+    web_search, get_news and the resolution worker on the same keep-alive pool.
+    """
+
+    def __init__(self, api_key: str) -> None:
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+
+    def search(self, query: str, **params: Any) -> Dict[str, Any]:
+        response = HTTP_SESSION.post(
+            TAVILY_SEARCH_URL,
+            json={"query": query, **params},
+            headers=self._headers,
+            timeout=TAVILY_TIMEOUT_S,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+@functools.lru_cache(maxsize=1)
+def get_tavily_client() -> TavilyClient:
+    """One Tavily client per process, shared by the search tools and the resolution worker."""
+    api_key = os.getenv("TAVILY_API_KEY")
+    if not api_key:
+        raise ValueError("TAVILY_API_KEY not found in environment variables")
+    return TavilyClient(api_key=api_key)
+
+
+# Characters NFKC leaves alone that we still want as plain ASCII
+ASCII_PUNCTUATION = str.maketrans({
+    "\u2018": "'", "\u2019": "'",  # Smart single quotes
+    "\u201c": '"', "\u201d": '"',  # Smart double quotes
+    "\u2013": "-", "\u2014": "-",  # Dashes
+})
+# (pattern, replacement) applied in order by strip_markdown
+MARKDOWN_SUBS = (
+    (re.compile(r"^#+\s*", re.MULTILINE), ""),  # Headers
+    (re.compile(r"(\*\*|__)(.*?)\1"), r"\2"),  # Bold
+    (re.compile(r"(\*|_)(.*?)\1"), r"\2"),  # Italic
+    (re.compile(r"\[([^\]]+)\]\([^\)]+\)"), r"\1"),  # Links [text](url) -> text
+    (re.compile(r"!\[([^\]]*)\]\([^\)]+\)"), r"[Image: \1]"),  # Images ![alt](url) -> [Image: alt]
+    (re.compile(r"^>\s*", re.MULTILINE), ""),  # Blockquotes
+)
+
+
+def strip_markdown(text: str) -> str:
+    """Plain-text version of a search result: NFKC, ASCII punctuation, no Markdown."""
+    text = unicodedata.normalize("NFKC", text).translate(ASCII_PUNCTUATION)
+    for pattern, replacement in MARKDOWN_SUBS:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
 class WebSearchInput(BaseModel):
     query: str = Field(description="The search query string")
 
@@ -52,42 +225,12 @@ class TavilySearchTool(Tool):
             description="Search the internet for current events, facts, or general knowledge using Tavily. Returns detailed content.",
             args_schema=WebSearchInput
         )
-        from tavily import TavilyClient
-        import os
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-             raise ValueError("TAVILY_API_KEY not found in environment variables")
-        self.client = TavilyClient(api_key=api_key)
+        self.client = get_tavily_client()
 
     def strip_markdown(self, text: str) -> str:
-        import re
-        import unicodedata
-        
-        # Normalize Unicode (NFKC) to fix non-breaking spaces, curly quotes, etc.
-        text = unicodedata.normalize('NFKC', text)
-        
-        # Manually replace smart quotes and other common chars that NFKC might miss for ASCII simplification
-        replacements = {
-            '\u2018': "'", '\u2019': "'", # Smart single quotes
-            '\u201c': '"', '\u201d': '"', # Smart double quotes
-            '\u2013': "-", '\u2014': "-"  # Dashes
-        }
-        for char, replacement in replacements.items():
-            text = text.replace(char, replacement)
-        
-        # Remove headers
-        text = re.sub(r"^#+\s*", "", text, flags=re.MULTILINE)
-        # Remove bold/italic
-        text = re.sub(r"(\*\*|__)(.*?)\1", r"\2", text)
-        text = re.sub(r"(\*|_)(.*?)\1", r"\2", text)
-        # Remove links [text](url) -> text
-        text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
-        # Remove images ![alt](url) -> [Image: alt]
-        text = re.sub(r"!\[([^\]]*)\]\([^\)]+\)", r"[Image: \1]", text)
-        # Remove blockquotes
-        text = re.sub(r"^>\s*", "", text, flags=re.MULTILINE)
-        return text.strip()
+        return strip_markdown(text)
 
+    @cached_tool(WEB_SEARCH_CACHE_TTL_S)
     def run(self, args: Any) -> str:
         try:
             validated = self.validate_args(args)
@@ -102,7 +245,7 @@ class TavilySearchTool(Tool):
                 title = r.get('title', 'No Title')
                 content = r.get('content', 'No Content')
                 # Strip Markdown from content
-                content = self.strip_markdown(content)
+                content = strip_markdown(content)
                 url = r.get('url', 'No URL')
                 results.append(f"Title: {title}\nContent: {content}\nSource: {url}")
             
@@ -116,6 +259,21 @@ class TavilySearchTool(Tool):
         except Exception as e:
             return f"Error performing search: {str(e)}"
 
+# WMO Weather interpretation codes (https://open-meteo.com/en/docs)
+WEATHER_CODES = {
+    0: "Clear sky",
+    1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Fog", 48: "Depositing rime fog",
+    51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
+    61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
+    71: "Slight snow fall", 73: "Moderate snow fall", 75: "Heavy snow fall",
+    77: "Snow grains",
+    80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
+    85: "Slight snow showers", 86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
+}
+
 class WeatherInput(BaseModel):
     city: str = Field(description="The city name")
 
@@ -127,23 +285,28 @@ class WeatherTool(Tool):
             args_schema=WeatherInput
         )
 
+    @cached_tool(WEATHER_CACHE_TTL_S)
     def run(self, args: Any) -> str:
         try:
             validated = self.validate_args(args)
             city = validated.city
             print(f"  [Tool] Getting Weather for: '{city}'")
             
-            # 1. Geocoding
-            geo_url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1&language=en&format=json"
-            geo_response = requests.get(geo_url)
-            if geo_response.status_code != 200:
-                 return f"Error finding location for {city}."
-            
-            geo_data = geo_response.json()
-            if not geo_data.get("results"):
-                return f"Could not find location: {city}"
+            # 1. Geocoding (cached per city; only the forecast needs to be live)
+            city_key = city.strip().lower()
+            location, fresh = GEOCODE_CACHE.get(city_key)
+            if not fresh:
+                geo_url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1&language=en&format=json"
+                geo_response = HTTP_SESSION.get(geo_url, timeout=HTTP_TIMEOUT_S)
+                if geo_response.status_code != 200:
+                     return f"Error finding location for {city}."
                 
-            location = geo_data["results"][0]
+                geo_data = geo_response.json()
+                if not geo_data.get("results"):
+                    return f"Could not find location: {city}"
+                    
+                location = geo_data["results"][0]
+                GEOCODE_CACHE.put(city_key, location, GEOCODE_CACHE_TTL_S)
             lat = location["latitude"]
             lon = location["longitude"]
             name = location["name"]
@@ -151,7 +314,7 @@ class WeatherTool(Tool):
 
             # 2. Weather Data
             weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m&wind_speed_unit=kmh"
-            weather_response = requests.get(weather_url)
+            weather_response = HTTP_SESSION.get(weather_url, timeout=HTTP_TIMEOUT_S)
             
             if weather_response.status_code != 200:
                 return f"Error fetching weather data for {name}."
@@ -163,21 +326,7 @@ class WeatherTool(Tool):
             wind = current.get("wind_speed_10m")
             code = current.get("weather_code")
             
-            # WMO Weather interpretation codes (https://open-meteo.com/en/docs)
-            weather_codes = {
-                0: "Clear sky",
-                1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-                45: "Fog", 48: "Depositing rime fog",
-                51: "Light drizzle", 53: "Moderate drizzle", 55: "Dense drizzle",
-                61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain",
-                71: "Slight snow fall", 73: "Moderate snow fall", 75: "Heavy snow fall",
-                77: "Snow grains",
-                80: "Slight rain showers", 81: "Moderate rain showers", 82: "Violent rain showers",
-                85: "Slight snow showers", 86: "Heavy snow showers",
-                95: "Thunderstorm",
-                96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
-            }
-            condition = weather_codes.get(code, "Unknown")
+            condition = WEATHER_CODES.get(code, "Unknown")
             
             return f"Weather in {name}, {country}: {condition}, Temperature: {temp}°C, Humidity: {humidity}%, Wind Speed: {wind} km/h"
 
@@ -186,6 +335,16 @@ class WeatherTool(Tool):
         except Exception as e:
             return f"Error getting weather: {e}"
 
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+# Plain-text intro, canonical URL and the disambiguation page prop, following redirects
+WIKIPEDIA_PAGE_PARAMS = {
+    "action": "query", "format": "json", "formatversion": 2, "redirects": 1,
+    "prop": "extracts|info|pageprops", "exintro": 1, "explaintext": 1,
+    "inprop": "url", "ppprop": "disambiguation",
+}
+# Wikimedia asks API clients to identify themselves
+WIKIPEDIA_HEADERS = {"User-Agent": "MumbaiHacksAgent/1.0 (wikipedia tool)"}
+
 class WikipediaInput(BaseModel):
     query: str = Field(description="The topic to search for on Wikipedia")
 
@@ -197,24 +356,41 @@ class WikipediaTool(Tool):
             args_schema=WikipediaInput
         )
 
+    def _search_titles(self, query: str) -> List[str]:
+        """Up to five article titles matching ``query`` (shown for ambiguous queries)."""
+        response = HTTP_SESSION.get(
+            WIKIPEDIA_API_URL,
+            params={"action": "opensearch", "search": query, "limit": 5, "namespace": 0, "format": "json"},
+            headers=WIKIPEDIA_HEADERS,
+            timeout=HTTP_TIMEOUT_S,
+        )
+        response.raise_for_status()
+        return response.json()[1]
+
+    @cached_tool(WIKIPEDIA_CACHE_TTL_S)
     def run(self, args: Any) -> str:
         try:
             validated = self.validate_args(args)
             query = validated.query
             print(f"  [Tool] Searching Wikipedia for: '{query}'")
             
-            # Get summary (limit to 3 sentences for brevity)
-            # Get page object to access URL
-            page = wikipedia.page(query, auto_suggest=False)
-            summary = page.summary
-            # Limit summary length manually since we are using page object
-            summary = ". ".join(summary.split(". ")[:20]) + "."
-            return f"Wikipedia Summary for '{query}':\n{summary}\nSource: {page.url}"
+            # Intro text, canonical URL and disambiguation flag in one small JSON response
+            response = HTTP_SESSION.get(
+                WIKIPEDIA_API_URL,
+                params={**WIKIPEDIA_PAGE_PARAMS, "titles": query},
+                headers=WIKIPEDIA_HEADERS,
+                timeout=HTTP_TIMEOUT_S,
+            )
+            response.raise_for_status()
+            page = response.json()["query"]["pages"][0]
+            if page.get("missing") or page.get("invalid"):
+                return f"Page not found for '{query}'."
+            if "disambiguation" in page.get("pageprops", {}):
+                return f"Ambiguous query. Possible options: {self._search_titles(query)}"
+            # Limit summary length manually; the intro can run long
+            summary = ". ".join(page.get("extract", "").split(". ")[:20]) + "."
+            return f"Wikipedia Summary for '{query}':\n{summary}\nSource: {page['fullurl']}"
             
-        except wikipedia.exceptions.DisambiguationError as e:
-            return f"Ambiguous query. Possible options: {e.options[:5]}"
-        except wikipedia.exceptions.PageError:
-            return f"Page not found for '{query}'."
         except ValidationError as e:
             return f"Argument Validation Error: {e}"
         except Exception as e:
@@ -231,13 +407,9 @@ class NewsTool(Tool):
             description="Get the latest news articles for a topic. Use this for current events, sports scores, or recent developments.",
             args_schema=NewsInput
         )
-        from tavily import TavilyClient
-        import os
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-             raise ValueError("TAVILY_API_KEY not found in environment variables")
-        self.client = TavilyClient(api_key=api_key)
+        self.client = get_tavily_client()
 
+    @cached_tool(NEWS_CACHE_TTL_S)
     def run(self, args: Any) -> str:
         try:
             validated = self.validate_args(args)
@@ -253,27 +425,7 @@ class NewsTool(Tool):
                 title = r.get('title', 'No Title')
                 content = r.get('content', 'No Content')
                 
-                # Strip Markdown from content
-                import re
-                import unicodedata
-                
-                # Normalize Unicode (NFKC)
-                content = unicodedata.normalize('NFKC', content)
-                
-                # Manually replace smart quotes and other common chars
-                replacements = {
-                    '\u2018': "'", '\u2019': "'", # Smart single quotes
-                    '\u201c': '"', '\u201d': '"', # Smart double quotes
-                    '\u2013': "-", '\u2014': "-"  # Dashes
-                }
-                for char, replacement in replacements.items():
-                    content = content.replace(char, replacement)
-                
-                content = re.sub(r"^#+\s*", "", content, flags=re.MULTILINE) # Headers
-                content = re.sub(r"(\*\*|__)(.*?)\1", r"\2", content) # Bold
-                content = re.sub(r"(\*|_)(.*?)\1", r"\2", content) # Italic
-                content = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", content) # Links
-                content = content.strip()
+                content = strip_markdown(content)
                 
                 url = r.get('url', 'No URL')
                 # Tavily news results often have a 'published_date' or similar, but 'content' is key
@@ -289,6 +441,43 @@ class NewsTool(Tool):
         except Exception as e:
             return f"Error fetching news: {str(e)}"
 
+# Arithmetic the calculator accepts; anything else in the parsed expression is rejected
+CALC_BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+CALC_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+# Characters a calculator expression may contain, checked before parsing
+CALC_ALLOWED_CHARS = frozenset("0123456789+-*/(). ")
+# Integer powers whose result would exceed this many bits are refused rather than
+# computed; bounding the result (not the exponent) also covers nested powers such
+# as 9**9**9 or ((9**999)**999)**999, which would hang the worker
+CALC_MAX_RESULT_BITS = 10_000
+
+
+def _eval_node(node: ast.AST) -> Any:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in CALC_BINARY_OPS:
+        left, right = _eval_node(node.left), _eval_node(node.right)
+        if (
+            isinstance(node.op, ast.Pow) and isinstance(left, int) and isinstance(right, int)
+            and abs(left).bit_length() * right > CALC_MAX_RESULT_BITS
+        ):
+            raise ValueError("result too large")
+        return CALC_BINARY_OPS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in CALC_UNARY_OPS:
+        return CALC_UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError("unsupported expression")
+
+
+@functools.lru_cache(maxsize=256)
+def safe_eval(expression: str) -> Any:
+    """Evaluate a plain arithmetic expression by walking its AST (no ``eval``)."""
+    return _eval_node(ast.parse(expression.strip(), mode="eval").body)
+
+
 class CalculatorInput(BaseModel):
     expression: str = Field(description="The math expression to evaluate (e.g., '25 * 4')")
 
@@ -305,10 +494,9 @@ class CalculatorTool(Tool):
             validated = self.validate_args(args)
             expression = validated.expression
             print(f"  [Tool] Calculating: '{expression}'")
-            allowed_chars = "0123456789+-*/(). "
-            if not all(c in allowed_chars for c in expression):
+            if not CALC_ALLOWED_CHARS.issuperset(expression):
                 return "Error: Invalid characters in expression."
-            result = eval(expression, {"__builtins__": None}, {})
+            result = safe_eval(expression)
             return f"Result: {result}"
         except ValidationError as e:
             return f"Argument Validation Error: {e}"
@@ -331,6 +519,36 @@ class TimeTool(Tool):
         now = datetime.now()
         return f"Current Time: {now.strftime('%Y-%m-%d %H:%M:%S')}"
 
+# Listings tried for every ticker, most preferred first (NSE, then BSE)
+TICKER_SUFFIXES = ("", ".NS", ".BO")
+# Shared across tool instances; sized for a few concurrent stock lookups
+QUOTE_EXECUTOR = ThreadPoolExecutor(max_workers=3 * len(TICKER_SUFFIXES), thread_name_prefix="quote")
+
+
+def fetch_quote(symbol: str) -> Tuple[Optional[float], Optional[str]]:
+    """Latest ``(price, currency)`` for a ticker, or ``(None, None)`` if it has no quote.
+
+    Uses yfinance's compact ``fast_info`` quote rather than the full ``info``
+    scrape, falling back to the last close of a one-day history. Lookup
+    failures (network, rate limits) raise, so callers can tell them apart
+    from an unknown ticker.
+    """
+    stock = yf.Ticker(symbol)
+    quote = stock.fast_info
+    try:
+        price = quote["last_price"]
+    except (KeyError, AttributeError, TypeError):
+        price = None
+    if price is None:
+        history = stock.history(period="1d")
+        price = None if history.empty else float(history["Close"].iloc[-1])
+    try:
+        currency = quote["currency"] or "USD"
+    except (KeyError, AttributeError, TypeError):
+        currency = "USD"
+    return price, currency
+
+
 class StockPriceInput(BaseModel):
     ticker: str = Field(description="The stock ticker symbol (e.g., 'AAPL')")
 
@@ -342,48 +560,38 @@ class StockPriceTool(Tool):
             args_schema=StockPriceInput
         )
 
+    @cached_tool(STOCK_CACHE_TTL_S)
     def run(self, args: Any) -> str:
         try:
             validated = self.validate_args(args)
             ticker = validated.ticker
             print(f"  [Tool] Getting Stock Price for: '{ticker}'")
             ticker = ticker.strip().upper()
-            # Helper to fetch price
-            def fetch_price(t):
+            # Look up the bare ticker and its Indian listings at once, but keep
+            # the bare > .NS > .BO preference when more than one resolves
+            futures = [
+                (ticker + suffix, QUOTE_EXECUTOR.submit(fetch_quote, ticker + suffix))
+                for suffix in TICKER_SUFFIXES
+            ]
+            price = currency = error = None
+            for symbol, future in futures:
+                if price:
+                    future.cancel()
+                    continue
                 try:
-                    stock = yf.Ticker(t)
-                    # fast_info is often faster/more reliable than info for price
-                    price = None
-                    if hasattr(stock, 'fast_info'):
-                        try:
-                            price = stock.fast_info.last_price
-                        except:
-                            pass
-                    
-                    if price is None:
-                         price = stock.info.get('currentPrice') or stock.info.get('regularMarketPrice')
-                    
-                    currency = stock.info.get('currency', 'USD')
-                    return price, currency
+                    p, c = future.result()
                 except Exception as e:
-                    print(f"  [Tool] Error fetching {t}: {e}")
-                    return None, None
-
-            price, currency = fetch_price(ticker)
-            
-            # If not found, try Indian suffixes
-            if not price:
-                for suffix in ['.NS', '.BO']:
-                    print(f"  [Tool] Retrying with suffix: {suffix}")
-                    p, c = fetch_price(ticker + suffix)
-                    if p:
-                        price = p
-                        currency = c
-                        ticker = ticker + suffix
-                        break
+                    print(f"  [Tool] Error fetching {symbol}: {e}")
+                    error = error or e
+                    continue
+                if p:
+                    price, currency, ticker = p, c, symbol
             
             if price:
                 return f"The current price of {ticker} is {price} {currency}."
+            elif error is not None:
+                # An error result, so it isn't cached and a stale price can stand in
+                return f"Error getting stock price for {ticker}: {error}"
             else:
                 return f"Could not fetch price for {ticker}. Check if the ticker is correct."
         except ValidationError as e:
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import os
 import random
-import time
 from dataclasses import dataclass
-from typing import Dict, List
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
 from shared.consensus import compute_confidence
-from shared.storage import load_runs, update_run
+from shared.storage import load_runs, runs_version, update_runs_bulk, wait_for_runs_change
+
+# Reviewers returned per lookup, best first
+REVIEWER_POOL_SIZE = 5
+# Mixed into each (run, reviewer) seed; change it to draw a different set of simulated votes
+VOTE_SEED = os.getenv("VOTE_SEED", "0")
+# Upper bound on how long main() sleeps between scans when no run is written
+VOTING_IDLE_RESCAN_S = 30
 
 @dataclass
 class Vote:
@@ -24,6 +32,15 @@ class Vote:
 class VotingService:
     def __init__(self) -> None:
         self.personas = self._load_personas()
+        # (persona, lowercased location, expertise set), normalised once for scoring
+        self._scoring_fields = [
+            (persona, persona["location"].lower(), frozenset(persona["expertise"]))
+            for persona in self.personas
+        ]
+        # Personas are fixed for the service's lifetime, so rankings are reused
+        self._reviewers_cache: Dict[Tuple[Optional[str], Optional[str]], List[Dict]] = {}
+        # runs_version() as of the last process_runs scan; unchanged means no new work
+        self.scanned_runs_version: Optional[Tuple[int, int]] = None
 
     def _load_personas(self) -> List[Dict]:
         path = os.path.join(os.path.dirname(__file__), "..", "data", "mock_users.json")
@@ -32,30 +49,46 @@ class VotingService:
 
     def fetch_relevant_reviewers(self, domain: str | None = None, location: str | None = None) -> List[Dict]:
         """Return top reviewers filtered by expertise/location."""
-        candidates = []
-        for persona in self.personas:
-            score = persona["precision"]
-            if domain in persona["expertise"]:
-                score += 0.05
-            if location and persona["location"].lower() == location.lower():
-                score += 0.03
-            candidates.append((score, persona))
-        candidates.sort(key=lambda tup: tup[0], reverse=True)
-        return [persona for _, persona in candidates[:5]]
+        location_lower = location.lower() if location else None
+        key = (domain, location_lower)
+        reviewers = self._reviewers_cache.get(key)
+        if reviewers is None:
+            candidates = []
+            for persona, persona_location, expertise in self._scoring_fields:
+                score = persona["precision"]
+                if domain in expertise:
+                    score += 0.05
+                if location_lower and persona_location == location_lower:
+                    score += 0.03
+                candidates.append((score, persona))
+            # Partial selection; ties keep persona order, as a stable full sort would
+            top = heapq.nlargest(REVIEWER_POOL_SIZE, candidates, key=itemgetter(0))
+            reviewers = self._reviewers_cache[key] = [persona for _, persona in top]
+        return list(reviewers)
 
     def simulate_vote(self, run_id: str, persona: Dict) -> Vote:
         weight = round(persona["precision"], 2)
-        vote_value = 1 if random.random() < persona["precision"] else -1
+        # Seeded per (run, reviewer): replays give the same vote, and there's no
+        # shared global generator to contend on
+        rng = random.Random(f"{VOTE_SEED}:{run_id}:{persona['user_id']}")
+        vote_value = 1 if rng.random() < persona["precision"] else -1
         rationale = f"Auto-generated vote by {persona['name']} (precision={persona['precision']})"
         return Vote(run_id=run_id, user_id=persona["user_id"], vote=vote_value, weight=weight, rationale=rationale)
 
 
 def process_runs(service: VotingService, required_votes: int = 3) -> None:
+    # Read the version before the runs so a write landing in between is rescanned
+    version = runs_version()
+    if version == service.scanned_runs_version:
+        return
+    service.scanned_runs_version = version
     runs = load_runs()
+    updates: Dict[str, Dict] = {}
     for run_id, data in runs.items():
         if data.get("status") != "awaiting_votes":
             continue
-        votes: List[Dict] = data.get("votes", [])
+        # Copy: stored runs are shared with the storage cache
+        votes: List[Dict] = list(data.get("votes", []))
         if len(votes) >= required_votes:
             continue
         reviewers = service.fetch_relevant_reviewers(domain=data.get("domain") or "technology", location=None)
@@ -64,15 +97,18 @@ def process_runs(service: VotingService, required_votes: int = 3) -> None:
             votes.append(vote.__dict__)
         confidence = compute_confidence(votes)
         status = "completed" if len(votes) >= required_votes else "awaiting_votes"
-        update_run(run_id, votes=votes, confidence=confidence, status=status)
+        updates[run_id] = {"votes": votes, "confidence": confidence, "status": status}
         print(f"[voting] run_id={run_id} votes={len(votes)} confidence={confidence}")
+    # One append to the runs log for the whole pass
+    update_runs_bulk(updates)
 
 
 def main() -> None:
     service = VotingService()
     while True:
         process_runs(service)
-        time.sleep(2)
+        # Sleep until a run is written (new or updated runs may need votes)
+        wait_for_runs_change(service.scanned_runs_version, timeout=VOTING_IDLE_RESCAN_S)
 
 
 if __name__ == "__main__":